@@ -41,7 +41,7 @@ from .models import (
 
 # Import main classes
 from .treasury import Treasury, treasury_session, create_treasury
-from .agents import AgentManager, create_agent_manager
+from .agents import AgentManager, create_agent_manager, set_tigergraph_factory
 from .tools import ToolRegistry
 
 # Import exceptions
@@ -206,6 +206,7 @@ __all__ = [
     "create_kip_layer",
     "create_treasury",
     "create_agent_manager",
+    "set_tigergraph_factory",
     
     # Exceptions
     "KIPLayerError",
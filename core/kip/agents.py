@@ -8,7 +8,7 @@ and caching for the KIP (Knowledge-Incentive Protocol) Layer.
 
 import asyncio
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 
 import pyTigerGraph as tg
 import structlog
@@ -18,6 +18,23 @@ from config import Config
 from clients.tigervector_client import get_tigergraph_connection
 from .models import KIPAgent, AgentStatus, AgentFunction, ToolCapability, KIPAnalytics
 
+# Factory used by AgentManager to open TigerGraph connections (see set_tigergraph_factory)
+_tigergraph_factory: Callable[[str], Optional[tg.TigerGraphConnection]] = get_tigergraph_connection
+
+
+def set_tigergraph_factory(
+    factory: Optional[Callable[[str], Optional[tg.TigerGraphConnection]]]
+) -> None:
+    """
+    Set the factory AgentManager uses to open TigerGraph connections.
+    
+    Args:
+        factory: Callable taking a graph name and returning a connection,
+                 or None to restore the default get_tigergraph_connection.
+    """
+    global _tigergraph_factory
+    _tigergraph_factory = factory or get_tigergraph_connection
+
 
 class AgentManager:
     """
@@ -57,7 +74,7 @@ class AgentManager:
         """Establish TigerGraph connection for agent data access."""
         try:
             # Use synchronous connection (pyTigerGraph doesn't support async)
-            self._connection = get_tigergraph_connection(self.config.tigergraph_graph_name)
+            self._connection = _tigergraph_factory(self.config.tigergraph_graph_name)
             
             if not self._connection:
                 raise ConnectionError("Failed to establish TigerGraph connection")
@@ -6,6 +6,7 @@ Handles ROI calculations, performance analytics, and economic insights.
 Extracted from Treasury for better modularity and maintainability.
 """
 
+import json
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, Any, List
 
@@ -200,11 +201,12 @@ class EconomicAnalyzer:
             performance_scores = []
             agent_performances = []
             
-            for key in budget_keys:
+            # Fetch every budget in one round trip instead of one GET per agent
+            budget_values = await self.redis.mget(budget_keys)
+            
+            for key, budget_data in zip(budget_keys, budget_values):
                 try:
-                    budget_data = await self.redis.get(key)
                     if budget_data:
-                        import json
                         budget_dict = json.loads(budget_data)
                         
                         total_balance += budget_dict.get("current_balance", 0)
@@ -8,7 +8,7 @@ Extracted from main.py for better modularity and maintainability.
 
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, WebSocket, HTTPException
+from fastapi import APIRouter, Depends, WebSocket, HTTPException
 import structlog
 
 from core.orchestrator import UserFacingOrchestrator
@@ -26,6 +26,10 @@ def set_orchestrator(orch: UserFacingOrchestrator):
     global orchestrator
     orchestrator = orch
 
+def get_orchestrator() -> UserFacingOrchestrator:
+    """FastAPI dependency resolving the orchestrator (overridable via app.dependency_overrides)."""
+    return orchestrator
+
 # Create router for chat endpoints
 router = APIRouter(prefix="/api", tags=["chat"])
 
@@ -35,7 +39,10 @@ async def test_endpoint():
     return {"status": "REST endpoint working", "timestamp": datetime.now(timezone.utc)}
 
 @router.post("/chat", response_model=SimpleChatResponse)
-async def simple_chat(request: SimpleChatRequest):
+async def simple_chat(
+    request: SimpleChatRequest,
+    orchestrator: UserFacingOrchestrator = Depends(get_orchestrator)
+):
     """
     Simple REST chat endpoint for testing the Smart Router.
     
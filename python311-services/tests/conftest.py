@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the test suite.
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def event_loop():
+    """One event loop per test module instead of one per test.
+    
+    Lets module-scoped async fixtures and shared stubs outlive a single test.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
@@ -26,16 +26,64 @@ All services will be available at:
 
 import sys
 import os
+import functools
+import json
+import shutil
+import socket
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
+import requests
+from dotenv import dotenv_values
+
+# Parse .env once; real environment variables take precedence over the file
+_ENV = {**dotenv_values(Path(__file__).parent / ".env"), **os.environ}
+
+_DEFAULT_VOICE_PYTHON = "C:/Users/Jake/AppData/Local/pypoetry/Cache/virtualenvs/python311-services-A1b0dxtl-py3.11/Scripts/python.exe"
+
+
+@dataclass(frozen=True, slots=True)
+class StartupSettings:
+    """Startup configuration resolved once at import"""
+    docker_exe: str
+    voice_python: str
+
+
+# Resolve the docker CLI once instead of going through a shell on every call
+_SETTINGS = StartupSettings(
+    docker_exe=shutil.which("docker") or _ENV.get("DOCKER_EXE_PATH", "docker"),
+    voice_python=_ENV.get("VOICE_PYTHON_PATH", _DEFAULT_VOICE_PYTHON),
+)
+
+# Compose file declaring the TigerGraph and Redis containers started in Steps 1-2
+_STARTUP_COMPOSE_FILE = str(Path(__file__).parent / "docker-compose.startup.yml")
+
+# Readiness polling backoff: detect fast starts quickly, then settle at 2s slices
+_BACKOFF_DELAYS = (0.25, 0.5, 1, 1)
+_BACKOFF_MAX_DELAY = 2
+
+
+def backoff_delays(total_seconds):
+    """Yield sleep intervals (exponential backoff) until total_seconds has elapsed"""
+    elapsed = 0.0
+    step = 0
+    while elapsed < total_seconds:
+        delay = _BACKOFF_DELAYS[step] if step < len(_BACKOFF_DELAYS) else _BACKOFF_MAX_DELAY
+        step += 1
+        elapsed += delay
+        yield delay
+
 def run_command(cmd, description, check=True, capture_output=False):
     """Run a command with error handling and show output"""
     print(f"🔄 {description}...")
-    print(f"   Command: {cmd}")
+    # argv lists are executed directly; plain strings still go through the shell
+    use_shell = isinstance(cmd, str)
+    print(f"   Command: {cmd if use_shell else ' '.join(cmd)}")
     try:
-        result = subprocess.run(cmd, check=check, capture_output=capture_output, text=True, shell=True)
+        result = subprocess.run(cmd, check=check, capture_output=capture_output, text=True, shell=use_shell)
         if result.returncode == 0:
             print(f"✅ {description} - Success")
             return True
@@ -46,20 +94,47 @@ def run_command(cmd, description, check=True, capture_output=False):
         print(f"❌ {description} - Error: {e}")
         return False
 
+# `docker ps` results are reused for this many seconds across container checks
+_CONTAINER_LIST_TTL = 0.5
+_container_list_cache = {"expires": 0.0, "names": ()}
+
+def get_running_container_names():
+    """List running container names, reusing the last `docker ps` within a short TTL"""
+    now = time.monotonic()
+    if now < _container_list_cache["expires"]:
+        return _container_list_cache["names"]
+    result = subprocess.run([_SETTINGS.docker_exe, "ps", "--format", "{{.Names}}"],
+                            capture_output=True, text=True)
+    names = tuple(result.stdout.splitlines()) if result.returncode == 0 else ()
+    _container_list_cache.update(expires=now + _CONTAINER_LIST_TTL, names=names)
+    return names
+
 def check_docker_container(container_name):
     """Check if a Docker container is running"""
     try:
-        result = subprocess.run(f"docker ps --format '{{{{.Names}}}}' | grep {container_name}", 
-                              shell=True, capture_output=True, text=True)
-        return result.returncode == 0
+        return any(container_name in name for name in get_running_container_names())
     except Exception as e:
         print(f"⚠️ Docker check error for {container_name}: {e}")
         return False
 
+def get_compose_running_services():
+    """Return the set of startup compose services whose containers are running"""
+    try:
+        result = subprocess.run([_SETTINGS.docker_exe, "compose", "-f", _STARTUP_COMPOSE_FILE, "ps", "--format", "json"],
+                                capture_output=True, text=True)
+        if result.returncode != 0 or not result.stdout.strip():
+            return set()
+        # Newer compose versions emit one JSON object per line, older ones a single array
+        output = result.stdout.strip()
+        entries = json.loads(output) if output.startswith("[") else [json.loads(line) for line in output.splitlines()]
+        return {entry.get("Service") for entry in entries if entry.get("State") == "running"}
+    except Exception as e:
+        print(f"⚠️ Docker compose status error: {e}")
+        return set()
+
 def check_tigergraph_ready():
     """Check if TigerGraph is ready and database is initialized"""
     try:
-        import requests
         response = requests.get("http://localhost:14240/api/ping", timeout=5)
         if response.status_code == 200:
             # Try to connect to the graph to see if it's initialized
@@ -73,43 +148,56 @@ def check_tigergraph_ready():
     except:
         return False
 
+@functools.lru_cache(maxsize=1)
+def get_ollama_models():
+    """Fetch the installed Ollama model names once per startup run
+
+    Returns a tuple of model names, or None if Ollama did not answer with 200.
+    Raises on connection errors so callers can report them.
+    """
+    response = requests.get("http://localhost:11434/api/tags", timeout=5)
+    if response.status_code != 200:
+        return None
+    return tuple(model.get('name', 'Unknown') for model in response.json().get('models', []))
+
 def start_services():
     """Start all services in the correct order"""
     print("🚀 Starting ALL Hybrid AI Council Services...")
     print("=" * 60)
     
     # Step 1: Check Docker
-    if not run_command("docker --version", "Checking Docker"):
+    # `docker info` answers from the daemon without enumerating containers
+    if not run_command([_SETTINGS.docker_exe, "info", "--format", "{{.ServerVersion}}"], "Checking Docker",
+                       capture_output=True):
         print("⚠️ Docker not available, but continuing...")
     
-    # Step 2: Start TigerGraph
-    print("\n📊 Step 1: Starting TigerGraph...")
-    if not check_docker_container("tigergraph"):
-        print("Starting TigerGraph...")
-        run_command("docker run -d --name tigergraph -p 14240:14240 -p 9000:9000 tigergraph/tigergraph-community:latest", "Starting TigerGraph container")
-        time.sleep(15)  # Wait longer for TigerGraph to start
-    else:
-        print("✅ TigerGraph already running")
+    # Steps 2-3: Start TigerGraph and Redis together via docker compose
+    print("\n📊 Steps 1-2: Starting TigerGraph and Redis...")
+    missing_services = [name for name in ("tigergraph", "redis") if not check_docker_container(name)]
+    for name in ("tigergraph", "redis"):
+        if name not in missing_services:
+            print(f"✅ {name} already running")
     
-    # Step 3: Start Redis
-    print("\n🔴 Step 2: Starting Redis...")
-    if not check_docker_container("redis"):
-        run_command("docker run -d --name redis -p 6379:6379 redis:latest", "Starting Redis container")
-        time.sleep(3)
-    else:
-        print("✅ Redis already running")
+    if missing_services:
+        run_command([_SETTINGS.docker_exe, "compose", "-f", _STARTUP_COMPOSE_FILE, "up", "-d", *missing_services],
+                    f"Starting containers: {', '.join(missing_services)}", check=False)
+        # Both containers boot in parallel; wait until compose reports them running
+        for delay in backoff_delays(30):
+            if set(missing_services) <= get_compose_running_services():
+                print("✅ Containers running")
+                break
+            time.sleep(delay)
+        else:
+            print("⚠️ Containers may not be fully running yet")
     
     # Step 4: Check Ollama (local installation)
     print("\n🤖 Step 3: Checking Ollama...")
     try:
-        import requests
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            models = data.get('models', [])
+        models = get_ollama_models()
+        if models is not None:
             print(f"✅ Ollama is running with {len(models)} models")
             for model in models:
-                print(f"   • {model.get('name', 'Unknown')}")
+                print(f"   • {model}")
         else:
             print("⚠️ Ollama may not be fully ready")
     except Exception as e:
@@ -119,14 +207,11 @@ def start_services():
     # Step 4.5: Verify Ollama models
     print("\n📦 Step 3.5: Verifying Ollama models...")
     try:
-        import requests
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            models = data.get('models', [])
+        models = get_ollama_models()
+        if models is not None:
             print(f"📋 Available models: {len(models)}")
             for model in models:
-                print(f"   • {model.get('name', 'Unknown')}")
+                print(f"   • {model}")
             
             # Check if required models are available
             required_models = [
@@ -136,10 +221,10 @@ def start_services():
             ]
             model_aliases = ["mistral-council", "qwen3-council", "deepseek-council"]
             
+            installed_models = set(models)
             all_models_available = True
-            for i, model in enumerate(required_models):
-                alias = model_aliases[i]
-                if any(m.get('name') == model for m in models):
+            for model, alias in zip(required_models, model_aliases):
+                if model in installed_models:
                     print(f"✅ Model available: {alias}")
                 else:
                     print(f"❌ Model missing: {alias}")
@@ -156,10 +241,9 @@ def start_services():
     print("\n🗄️ Step 4: Initializing TigerGraph database...")
     # Wait for TigerGraph to be ready before initializing
     print("⏳ Waiting for TigerGraph to be ready...")
-    for i in range(30):
-        time.sleep(2)
+    for delay in backoff_delays(60):
+        time.sleep(delay)
         try:
-            import requests
             response = requests.get("http://localhost:14240/api/ping", timeout=5)
             if response.status_code == 200:
                 print("✅ TigerGraph is ready")
@@ -187,10 +271,9 @@ def start_services():
     
     # Start voice service in background
     print("🔄 Starting voice service...")
-    # Use the direct Python executable from the virtual environment
-    python_exe = "C:/Users/Jake/AppData/Local/pypoetry/Cache/virtualenvs/python311-services-A1b0dxtl-py3.11/Scripts/python.exe"
-    voice_cmd = f"cd {voice_dir} && \"{python_exe}\" voice/main.py"
-    voice_process = subprocess.Popen(voice_cmd, shell=True)  # Remove pipe capture to keep process alive
+    # Use the direct Python executable from the virtual environment (VOICE_PYTHON_PATH overrides)
+    voice_process = subprocess.Popen([_SETTINGS.voice_python, "voice/main.py"], cwd=str(voice_dir),
+                                     close_fds=True)  # No pipe capture, keeps process alive
     
     print("✅ Voice service started in background")
     
@@ -199,7 +282,6 @@ def start_services():
     for i in range(60):  # 60 second timeout
         time.sleep(1)
         try:
-            import requests
             response = requests.get("http://localhost:8011/health", timeout=2)
             if response.status_code == 200:
                 data = response.json()
@@ -218,9 +300,11 @@ def start_services():
     
     # Step 7: Start main API server
     print("\n🌐 Step 6: Starting Main API Server...")
-    api_cmd = "python -m uvicorn main:app --host 127.0.0.1 --port 8001 --timeout-keep-alive 5"
-    print(f"🔄 Starting main API: {api_cmd}")
-    api_process = subprocess.Popen(api_cmd, shell=True)  # Remove pipe capture to keep process alive
+    api_cmd = [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", "8001",
+               "--timeout-keep-alive", "5"]
+    print(f"🔄 Starting main API: {' '.join(api_cmd)}")
+    api_process = subprocess.Popen(api_cmd, cwd=str(Path(__file__).parent),
+                                   close_fds=True)  # No pipe capture, keeps process alive
     
     print("✅ Main API server started in background")
     
@@ -229,7 +313,6 @@ def start_services():
     for i in range(30):  # 30 second timeout
         time.sleep(1)
         try:
-            import requests
             response = requests.get("http://localhost:8001/health", timeout=2)
             if response.status_code == 200:
                 print("✅ Main API server ready")
@@ -242,6 +325,24 @@ def start_services():
     
     return True
 
+def check_service(name, url):
+    """Probe a single service; returns (ready, status line)"""
+    try:
+        if name == "Redis":
+            # Redis doesn't have HTTP endpoint, just check if port is open
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            result = sock.connect_ex(('localhost', 6379))
+            sock.close()
+            if result == 0:
+                return True, f"✅ {name}: Running"
+            return False, f"❌ {name}: Not responding"
+        response = requests.get(url, timeout=5)
+        if response.status_code == 200:
+            return True, f"✅ {name}: Healthy"
+        return False, f"❌ {name}: Unhealthy ({response.status_code})"
+    except Exception as e:
+        return False, f"❌ {name}: Error - {e}"
+
 def verify_services():
     """Verify all services are running"""
     print("\n🔍 Step 7: Verifying All Services...")
@@ -254,33 +355,14 @@ def verify_services():
         ("Main API", "http://localhost:8001/health")
     ]
     
-    all_ready = True
-    for name, url in services:
-        try:
-            import requests
-            if name == "Redis":
-                # Redis doesn't have HTTP endpoint, just check if port is open
-                import socket
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                result = sock.connect_ex(('localhost', 6379))
-                sock.close()
-                if result == 0:
-                    print(f"✅ {name}: Running")
-                else:
-                    print(f"❌ {name}: Not responding")
-                    all_ready = False
-            else:
-                response = requests.get(url, timeout=5)
-                if response.status_code == 200:
-                    print(f"✅ {name}: Healthy")
-                else:
-                    print(f"❌ {name}: Unhealthy ({response.status_code})")
-                    all_ready = False
-        except Exception as e:
-            print(f"❌ {name}: Error - {e}")
-            all_ready = False
+    # The probes are independent, so run them concurrently and report in order
+    with ThreadPoolExecutor(max_workers=len(services)) as executor:
+        results = list(executor.map(lambda service: check_service(*service), services))
+    
+    for _, line in results:
+        print(line)
     
-    return all_ready
+    return all(ready for ready, _ in results)
 
 if __name__ == "__main__":
     try:
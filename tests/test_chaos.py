@@ -11,23 +11,28 @@ The chaos engineering philosophy: "What doesn't kill the system makes it stronge
 import sys
 import os
 import pytest
-import asyncio
+import functools
 import time
+from contextlib import contextmanager
 from unittest.mock import AsyncMock, patch
-from datetime import datetime, timezone
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import docker
-from docker.errors import NotFound, APIError
+import redis
+from docker.errors import NotFound
+from requests.exceptions import ConnectionError as RequestsConnectionError, ReadTimeout
 
-from core.orchestrator import UserFacingOrchestrator, OrchestratorState, ProcessingPhase
-from core.kip import kip_session, treasury_session
+from core.orchestrator import UserFacingOrchestrator, ProcessingPhase
+from core.kip import kip_session, treasury_session, set_tigergraph_factory
 from core.pheromind import pheromind_session
 
-# Clean config import
-from config import Config
+
+@functools.lru_cache(maxsize=1)
+def get_docker_client():
+    """Create the Docker daemon client once and share it across chaos tests."""
+    return docker.from_env()
 
 
 class ChaosTestManager:
@@ -39,10 +44,15 @@ class ChaosTestManager:
     """
     
     def __init__(self):
-        self.docker_client = docker.from_env()
+        self.docker_client = get_docker_client()
         self.redis_container_name = "hybrid-cognitive-architecture-redis-1"
         self.redis_was_running = False
         
+    @functools.cached_property
+    def redis_container(self):
+        """Redis container handle, fetched once and refreshed with reload() afterwards."""
+        return self.get_redis_container()
+        
     def get_redis_container(self):
         """Get the Redis container, handling cases where it might not exist."""
         try:
@@ -50,21 +60,45 @@ class ChaosTestManager:
         except NotFound:
             pytest.skip(f"Redis container '{self.redis_container_name}' not found. Run 'docker-compose up -d redis' first.")
             
+    def wait_for_redis_ping(self, timeout):
+        """Retry PING with exponential backoff until Redis answers or timeout elapses."""
+        client = redis.Redis(
+            host=os.getenv("REDIS_HOST", "localhost"),
+            port=int(os.getenv("REDIS_PORT", 6379)),
+            socket_connect_timeout=0.5
+        )
+        deadline = time.monotonic() + max(timeout, 0)
+        delay = 0.05
+        try:
+            while True:
+                try:
+                    if client.ping():
+                        return True
+                except redis.exceptions.RedisError:
+                    pass
+                if time.monotonic() + delay > deadline:
+                    return False
+                time.sleep(delay)
+                delay = min(delay * 2, 1.0)
+        finally:
+            client.close()
+            
     def stop_redis(self):
         """Stop Redis container and record its initial state."""
-        container = self.get_redis_container()
+        container = self.redis_container
         self.redis_was_running = container.status == 'running'
         
         if self.redis_was_running:
             print(f"🔥 CHAOS: Stopping Redis container '{self.redis_container_name}'...")
             container.stop()
             
-            # Wait for container to actually stop
+            # Block at the daemon until the container has exited
             timeout = 10
-            start_time = time.time()
-            while container.status == 'running' and (time.time() - start_time) < timeout:
-                time.sleep(0.5)
-                container.reload()
+            try:
+                container.wait(timeout=timeout)
+            except (ReadTimeout, RequestsConnectionError):
+                pass  # Timed out; the status check below reports the failure
+            container.reload()
                 
             if container.status == 'running':
                 pytest.fail(f"Failed to stop Redis container within {timeout} seconds")
@@ -75,7 +109,7 @@ class ChaosTestManager:
             
     def start_redis(self):
         """Restart Redis container if it was running before the test."""
-        container = self.get_redis_container()
+        container = self.redis_container
         
         if self.redis_was_running and container.status != 'running':
             print(f"🔄 RECOVERY: Starting Redis container '{self.redis_container_name}'...")
@@ -83,16 +117,18 @@ class ChaosTestManager:
             
             # Wait for container to actually start
             timeout = 15
-            start_time = time.time()
-            while container.status != 'running' and (time.time() - start_time) < timeout:
-                time.sleep(0.5)
+            deadline = time.monotonic() + timeout
+            container.reload()
+            while container.status != 'running' and time.monotonic() < deadline:
+                time.sleep(0.05)
                 container.reload()
                 
             if container.status != 'running':
                 pytest.fail(f"Failed to restart Redis container within {timeout} seconds")
                 
-            # Give Redis a moment to fully initialize
-            time.sleep(2)
+            # Wait until Redis actually answers instead of sleeping a fixed amount
+            if not self.wait_for_redis_ping(timeout=10):
+                pytest.fail("Redis did not answer PING within 10 seconds of restart")
             print(f"✅ Redis container restarted (status: {container.status})")
         else:
             print(f"ℹ️  Redis restart not needed (was_running: {self.redis_was_running}, status: {container.status})")
@@ -112,8 +148,16 @@ def chaos_manager():
             print(f"⚠️  Warning: Failed to restart Redis during cleanup: {e}")
 
 
+@pytest.fixture(scope="session")
+def shared_orchestrator():
+    """Build the orchestrator (and its state machine graph) once for all chaos tests."""
+    return UserFacingOrchestrator()
+
+
+@pytest.mark.chaos
+@pytest.mark.slow
 @pytest.mark.asyncio
-async def test_orchestrator_handles_redis_failure(chaos_manager):
+async def test_orchestrator_handles_redis_failure(chaos_manager, shared_orchestrator):
     """
     Test that the orchestrator gracefully handles Redis infrastructure failure.
     
@@ -123,9 +167,8 @@ async def test_orchestrator_handles_redis_failure(chaos_manager):
     print("🧪 CHAOS TEST: Orchestrator Redis Failure Resilience")
     print("=" * 55)
     
-    # Initialize orchestrator (gets config from environment)
-    config = Config()
-    orchestrator = UserFacingOrchestrator()
+    # Orchestrator is shared across the session (gets config from environment)
+    orchestrator = shared_orchestrator
     
     # Test 1: Normal operation (baseline)
     print("📊 Phase 1: Baseline test with Redis running...")
@@ -237,138 +280,120 @@ async def test_orchestrator_handles_redis_failure(chaos_manager):
     print("🎉 CHAOS TEST COMPLETED: System demonstrates excellent resilience!")
 
 
-@pytest.mark.asyncio
-async def test_pheromind_layer_redis_failure():
-    """
-    Test that the Pheromind layer gracefully handles Redis failures.
-    
-    When Redis is down, pheromone operations should fail gracefully
-    without crashing the entire system.
-    """
-    print("🧪 CHAOS TEST: Pheromind Redis Failure Resilience")
-    print("=" * 50)
-    
-    # Test with Redis running (baseline)
-    try:
-        async with pheromind_session() as pheromind:
-            signals = await pheromind.query_signals("test_pattern")
-            print("✅ Baseline: Pheromind layer working normally")
-    except Exception as e:
-        pytest.skip(f"Cannot test Pheromind resilience - baseline failed: {e}")
-    
-    # Temporarily stop Redis using Docker
-    docker_client = docker.from_env()
-    try:
-        redis_container = docker_client.containers.get("hybrid-cognitive-architecture-redis-1")
-        was_running = redis_container.status == 'running'
-        
-        if was_running:
-            redis_container.stop()
-            time.sleep(2)  # Wait for stop
-            
-            # Test Pheromind behavior with Redis down
-            try:
-                async with pheromind_session() as pheromind:
-                    # This should fail gracefully, not crash
-                    with pytest.raises((ConnectionError, TimeoutError, Exception)):
-                        await pheromind.query_signals("test_pattern")
-                        
-                print("✅ Pheromind layer fails gracefully when Redis is down")
-                
-            except Exception as e:
-                pytest.fail(f"Pheromind layer crashed ungracefully: {e}")
-                
-            finally:
-                # Always restart Redis
-                if was_running:
-                    redis_container.start()
-                    time.sleep(3)  # Wait for startup
-                    
-    except NotFound:
-        pytest.skip("Redis container not found - cannot test Redis failure scenarios")
+@contextmanager
+def simulated_pheromind_redis_failure():
+    """Make the Pheromind Redis client fail its connection ping."""
+    with patch('core.pheromind.redis.Redis') as mock_redis:
+        mock_redis.return_value.ping = AsyncMock(
+            side_effect=redis.exceptions.ConnectionError("Simulated Redis failure")
+        )
+        yield
 
 
-@pytest.mark.asyncio
-async def test_treasury_redis_failure():
-    """
-    Test that the Treasury system gracefully handles Redis failures.
-    
-    Economic operations should fail gracefully when Redis cache is unavailable,
-    potentially falling back to TigerGraph for critical operations.
-    """
-    print("🧪 CHAOS TEST: Treasury Redis Failure Resilience") 
-    print("=" * 48)
-    
-    # Test with Redis running (baseline)
-    try:
-        async with treasury_session() as treasury:
-            analytics = await treasury.get_economic_analytics()
-            print("✅ Baseline: Treasury working normally")
-    except Exception as e:
-        pytest.skip(f"Cannot test Treasury resilience - baseline failed: {e}")
-    
-    # Note: For now, we'll just verify the Treasury handles Redis connection errors gracefully
-    # Full chaos testing would require stopping Redis, but that's covered in the main test
-    
-    # Test invalid Redis configuration (simulates connection failure)
+@contextmanager
+def simulated_treasury_redis_failure():
+    """Make Treasury Redis client construction raise a connection error."""
     with patch('core.kip.treasury_core.redis.Redis') as mock_redis:
         mock_redis.side_effect = ConnectionError("Simulated Redis failure")
-        
-        try:
-            async with treasury_session() as treasury:
-                # This should handle the Redis failure gracefully
-                # Either by falling back to TigerGraph or failing with a clear error
-                with pytest.raises((ConnectionError, Exception)):
-                    await treasury.get_budget("test_agent")
-                    
-            print("✅ Treasury handles Redis failures gracefully")
-            
-        except Exception as e:
-            # Check if this is a graceful failure or catastrophic crash
-            if "redis" in str(e).lower() or "connection" in str(e).lower():
-                print("✅ Treasury fails gracefully when Redis is unavailable")
-            else:
-                pytest.fail(f"Treasury crashed ungracefully: {e}")
+        yield
 
 
-@pytest.mark.asyncio  
-async def test_kip_layer_partial_failure():
+@contextmanager
+def simulated_tigergraph_failure():
+    """Make the KIP agent manager's TigerGraph connection attempts raise a connection error."""
+    def failing_connection(graph_name):
+        raise ConnectionError("Simulated TigerGraph failure")
+    
+    set_tigergraph_factory(failing_connection)
+    try:
+        yield
+    finally:
+        set_tigergraph_factory(None)
+
+
+# Errors a layer may raise when its backing store is down (passed to pytest.raises)
+LAYER_OUTAGE_ERRORS = (ConnectionError, TimeoutError, Exception)
+
+# Each row: scenario name, session factory, baseline probe, failure injector, probe under
+# failure, exceptions the probe must raise (None: it must return None in degraded mode),
+# and error keywords that count as a graceful failure if the session itself raises.
+LAYER_FAILURE_SCENARIOS = [
+    pytest.param(
+        "pheromind-redis",
+        pheromind_session,
+        lambda pheromind: pheromind.query_signals("test_pattern"),
+        simulated_pheromind_redis_failure,
+        lambda pheromind: pheromind.query_signals("test_pattern"),
+        LAYER_OUTAGE_ERRORS,
+        (),
+        id="pheromind-redis",
+    ),
+    pytest.param(
+        "treasury-redis",
+        treasury_session,
+        lambda treasury: treasury.get_economic_analytics(),
+        simulated_treasury_redis_failure,
+        lambda treasury: treasury.get_budget("test_agent"),
+        LAYER_OUTAGE_ERRORS,
+        ("redis", "connection"),
+        id="treasury-redis",
+    ),
+    pytest.param(
+        "kip-tigergraph",
+        kip_session,
+        lambda kip: kip.list_agents(),
+        simulated_tigergraph_failure,
+        lambda kip: kip.load_agent("test_agent_001"),
+        None,
+        ("tigergraph", "connection"),
+        id="kip-tigergraph",
+    ),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "scenario,session_factory,baseline_probe,simulate_failure,failure_probe,expected_raises,graceful_errors",
+    LAYER_FAILURE_SCENARIOS
+)
+async def test_layer_dependency_failure(scenario, session_factory, baseline_probe, simulate_failure,
+                                        failure_probe, expected_raises, graceful_errors):
     """
-    Test that the KIP layer handles partial system failures gracefully.
+    Test that each cognitive layer degrades gracefully when its backing store fails.
     
-    When some components are unavailable, the system should continue
-    operating with degraded functionality rather than complete failure.
+    Pheromind and Treasury should raise a clear error when Redis is unavailable;
+    KIP should keep operating and return None for agents it cannot load from TigerGraph.
     """
-    print("🧪 CHAOS TEST: KIP Layer Partial Failure Resilience")
-    print("=" * 52)
+    print(f"🧪 CHAOS TEST: {scenario} failure resilience")
+    print("=" * 50)
     
-    # Test with full system (baseline)
+    # Test with the full system (baseline)
     try:
-        async with kip_session() as kip:
-            agents = await kip.list_agents()
-            print(f"✅ Baseline: KIP layer working normally ({len(agents)} agents)")
+        async with session_factory() as layer:
+            await baseline_probe(layer)
+            print(f"✅ Baseline: {scenario} working normally")
     except Exception as e:
-        pytest.skip(f"Cannot test KIP resilience - baseline failed: {e}")
+        pytest.skip(f"Cannot test {scenario} resilience - baseline failed: {e}")
     
-    # Simulate TigerGraph connection issues
-    with patch('clients.tigervector_client.get_tigergraph_connection') as mock_tg:
-        mock_tg.side_effect = ConnectionError("Simulated TigerGraph failure")
-        
+    with simulate_failure():
         try:
-            async with kip_session() as kip:
-                # This should handle TigerGraph failure gracefully (not crash)
-                result = await kip.load_agent("test_agent_001")
-                
-                # System should gracefully return None for missing agent, not crash
-                assert result is None, "Expected None for missing agent in degraded mode"
+            async with session_factory() as layer:
+                if expected_raises is not None:
+                    # This should fail gracefully, not crash
+                    with pytest.raises(expected_raises):
+                        await failure_probe(layer)
+                else:
+                    # System should gracefully return None in degraded mode, not crash
+                    result = await failure_probe(layer)
+                    assert result is None, "Expected None in degraded mode"
                     
-            print("✅ KIP layer handles TigerGraph failures gracefully")
+            print(f"✅ {scenario} handles the failure gracefully")
             
         except Exception as e:
-            if "tigergraph" in str(e).lower() or "connection" in str(e).lower():
-                print("✅ KIP fails gracefully when TigerGraph is unavailable")
+            if any(keyword in str(e).lower() for keyword in graceful_errors):
+                print(f"✅ {scenario} fails gracefully when its dependency is unavailable")
             else:
-                pytest.fail(f"KIP layer crashed ungracefully: {e}")
+                pytest.fail(f"{scenario} crashed ungracefully: {e}")
 
 
 if __name__ == "__main__":
@@ -377,5 +402,6 @@ if __name__ == "__main__":
     print("Testing system resilience under failure conditions...")
     print()
     
-    # Run with pytest: poetry run pytest tests/test_chaos.py -v -s
-    pytest.main([__file__, "-v", "-s"])
\ No newline at end of file
+    # Run with pytest: poetry run pytest tests/test_chaos.py -v -s -m chaos
+    # (the Docker-driven tests are excluded from the default run by the 'chaos' marker)
+    pytest.main([__file__, "-v", "-s", "-m", "chaos or not chaos"])
\ No newline at end of file
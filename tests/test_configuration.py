@@ -13,57 +13,104 @@ from config import Config
 from config.models import ANALYTICAL_MODEL, CREATIVE_MODEL, COORDINATOR_MODEL
 
 
+# Environment overrides, built once and shared by the tests that patch os.environ
+PRODUCTION_ENV = {
+    'ENVIRONMENT': 'production',
+    'TIGERGRAPH_PASSWORD': 'secure_test_password_123'  # Required for production
+}
+OVERRIDE_ENV = {
+    **PRODUCTION_ENV,
+    'SECURITY_ENABLED': 'true',
+    'RATE_LIMITING_ENABLED': 'false',
+    'CORS_ALLOWED_ORIGINS': 'https://example.com,https://api.example.com'
+}
+SECURITY_HEADERS_ENV = {
+    'CSP_POLICY': "default-src 'self'; script-src 'none'",
+    'HSTS_MAX_AGE': '63072000'
+}
+
+# (field, default) pairs checked against the unpatched environment
+DEFAULT_VALUES = [
+    # Security defaults
+    ('security_enabled', True),  # Default should be enabled
+    ('rate_limiting_enabled', True),
+    ('rate_limit_requests_per_minute', 100),
+    ('rate_limit_websocket_connections', 5),
+    # Cache defaults
+    ('cache_enabled', True),
+    ('cache_ttl_hours', 24),
+    # Request validation defaults
+    ('max_request_size_mb', 10),
+    ('max_json_size_mb', 1),
+    ('max_query_params', 50),
+]
+
+# Parsed once at import from the unpatched environment; read-only tests share it
+_CONFIG = Config()
+CONFIG_FIELDS = frozenset(Config.model_fields)
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Shared configuration for tests that don't patch the environment."""
+    return _CONFIG
+
+
 class TestConfiguration:
     """Test configuration management."""
     
     def test_config_initialization(self):
         """Test basic configuration initialization."""
-        config = Config()
-        
         # Test basic settings
-        assert hasattr(config, 'environment')
-        assert hasattr(config, 'api_host')
-        assert hasattr(config, 'api_port')
-        assert hasattr(config, 'log_level')
+        assert {
+            'environment',
+            'api_host',
+            'api_port',
+            'log_level',
+        } <= CONFIG_FIELDS
     
     def test_security_configuration(self):
         """Test security-related configuration."""
-        config = Config()
-        
         # Test security flags
-        assert hasattr(config, 'security_enabled')
-        assert hasattr(config, 'rate_limiting_enabled')
-        assert hasattr(config, 'security_headers_enabled')
-        assert hasattr(config, 'request_validation_enabled')
+        assert {
+            'security_enabled',
+            'rate_limiting_enabled',
+            'security_headers_enabled',
+            'request_validation_enabled',
+        } <= CONFIG_FIELDS
         
         # Test rate limiting config
-        assert hasattr(config, 'rate_limit_requests_per_minute')
-        assert hasattr(config, 'rate_limit_requests_per_hour')
-        assert hasattr(config, 'rate_limit_chat_per_minute')
-        assert hasattr(config, 'rate_limit_voice_per_minute')
-        assert hasattr(config, 'rate_limit_websocket_connections')
+        assert {
+            'rate_limit_requests_per_minute',
+            'rate_limit_requests_per_hour',
+            'rate_limit_chat_per_minute',
+            'rate_limit_voice_per_minute',
+            'rate_limit_websocket_connections',
+        } <= CONFIG_FIELDS
     
     def test_cors_configuration(self):
         """Test CORS configuration."""
-        config = Config()
-        
-        assert hasattr(config, 'cors_allowed_origins')
-        assert hasattr(config, 'cors_allow_credentials')
-        assert hasattr(config, 'cors_allowed_methods')
-        assert hasattr(config, 'cors_allowed_headers')
+        assert {
+            'cors_allowed_origins',
+            'cors_allow_credentials',
+            'cors_allowed_methods',
+            'cors_allowed_headers',
+        } <= CONFIG_FIELDS
     
     def test_cache_configuration(self):
         """Test cache configuration."""
-        config = Config()
-        
-        assert hasattr(config, 'cache_enabled')
-        assert hasattr(config, 'cache_ttl_hours')
-        assert hasattr(config, 'cache_max_prompt_length')
-        assert hasattr(config, 'cache_similarity_threshold')
+        assert {
+            'cache_enabled',
+            'cache_ttl_hours',
+            'cache_max_prompt_length',
+            'cache_similarity_threshold',
+        } <= CONFIG_FIELDS
     
-    def test_url_properties(self):
+    def test_url_properties(self, config):
         """Test URL generation properties."""
-        config = Config()
+        # Computed properties aren't model fields; check them on the class
+        for name in ('redis_url', 'tigergraph_url', 'ollama_url'):
+            assert isinstance(getattr(Config, name), property)
         
         redis_url = config.redis_url
         assert "redis://" in redis_url
@@ -76,13 +123,7 @@ class TestConfiguration:
         assert "http://" in ollama_url
         assert str(config.ollama_port) in ollama_url
     
-    @patch.dict(os.environ, {
-        'ENVIRONMENT': 'production',
-        'SECURITY_ENABLED': 'true',
-        'RATE_LIMITING_ENABLED': 'false',
-        'CORS_ALLOWED_ORIGINS': 'https://example.com,https://api.example.com',
-        'TIGERGRAPH_PASSWORD': 'secure_test_password_123'  # Required for production
-    })
+    @patch.dict(os.environ, OVERRIDE_ENV)
     def test_environment_overrides(self):
         """Test environment variable overrides."""
         config = Config()
@@ -92,31 +133,12 @@ class TestConfiguration:
         assert config.rate_limiting_enabled is False
         assert 'https://example.com' in config.cors_allowed_origins
     
-    def test_default_values(self):
+    @pytest.mark.parametrize("field_name,expected", DEFAULT_VALUES)
+    def test_default_values(self, config, field_name, expected):
         """Test configuration default values."""
-        config = Config()
-        
-        # Test security defaults
-        assert config.security_enabled is True  # Default should be enabled
-        assert config.rate_limiting_enabled is True
-        assert config.rate_limit_requests_per_minute == 100
-        assert config.rate_limit_websocket_connections == 5
-        
-        # Test cache defaults
-        assert config.cache_enabled is True
-        assert config.cache_ttl_hours == 24
-    
-    def test_validation_configuration(self):
-        """Test request validation configuration."""
-        config = Config()
-        
-        assert hasattr(config, 'max_request_size_mb')
-        assert hasattr(config, 'max_json_size_mb')
-        assert hasattr(config, 'max_query_params')
-        
-        assert config.max_request_size_mb == 10
-        assert config.max_json_size_mb == 1
-        assert config.max_query_params == 50
+        value = getattr(config, field_name)
+        assert value == expected
+        assert type(value) is type(expected)  # Keep `is True` strictness for flags
 
 
 class TestModelConfiguration:
@@ -147,20 +169,15 @@ class TestModelConfiguration:
 class TestConfigurationSecurity:
     """Test security aspects of configuration."""
     
-    def test_password_handling(self):
+    def test_password_handling(self, config):
         """Test secure password handling."""
-        config = Config()
-        
         # Test that password is handled securely
-        assert hasattr(config, 'tigergraph_password')
+        assert 'tigergraph_password' in CONFIG_FIELDS
         # Password should not be empty in most cases
         if config.tigergraph_password:
             assert isinstance(config.tigergraph_password, str)
     
-    @patch.dict(os.environ, {
-        'CSP_POLICY': "default-src 'self'; script-src 'none'",
-        'HSTS_MAX_AGE': '63072000'
-    })
+    @patch.dict(os.environ, SECURITY_HEADERS_ENV)
     def test_security_headers_config(self):
         """Test security headers configuration."""
         config = Config()
@@ -168,19 +185,16 @@ class TestConfigurationSecurity:
         assert "default-src 'self'" in config.csp_policy
         assert config.hsts_max_age == 63072000
     
+    @patch.dict(os.environ, PRODUCTION_ENV)
     def test_production_security_defaults(self):
         """Test that production has secure defaults."""
-        with patch.dict(os.environ, {
-            'ENVIRONMENT': 'production',
-            'TIGERGRAPH_PASSWORD': 'secure_test_password_123'  # Required for production
-        }):
-            config = Config()
-            
-            # Production should have security enabled
-            assert config.security_enabled is True
-            assert config.rate_limiting_enabled is True
-            assert config.security_headers_enabled is True
-            assert config.request_validation_enabled is True
+        config = Config()
+        
+        # Production should have security enabled
+        assert config.security_enabled is True
+        assert config.rate_limiting_enabled is True
+        assert config.security_headers_enabled is True
+        assert config.request_validation_enabled is True
 
 
 if __name__ == "__main__":
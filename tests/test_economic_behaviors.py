@@ -19,85 +19,277 @@ Test Coverage:
 4. Economic Analytics - System-wide financial health metrics
 5. Performance Adjustments - Automated budget increases/decreases based on ROI
 6. Economic Scenarios - Real-world business decision workflows with costs
+
+Everything external is mocked and the shared payloads are read-only, so the
+classes are independent and can be spread across cores:
+    pytest -n auto tests/test_economic_behaviors.py  (requires pytest-xdist)
 """
 
-import asyncio
+import heapq
+import numpy as np
 import pytest
 import json
-from datetime import datetime, timezone, timedelta, date
-from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, patch
-from typing import List, Dict, Any
+import operator
+from collections import namedtuple
+from datetime import date
+from fractions import Fraction
+from types import MappingProxyType
+from unittest.mock import AsyncMock
+from typing import List, Dict, Optional
 
 # Import KIP economic components
 from core.kip.models import (
     AgentBudget, Transaction, TransactionType, Tool,
-    EconomicAnalytics, KIPAnalytics, ActionResult
+    EconomicAnalytics, ActionResult
 )
 from core.kip.economic_analyzer import EconomicAnalyzer
 from core.kip.budget_manager import BudgetManager
 from core.kip.transaction_processor import TransactionProcessor
 from core.kip.treasury_core import TreasuryCore
-from core.kip.agents import AgentManager
 
-# Import web tools for realistic cost scenarios
-from tools.web_tools import get_current_bitcoin_price, get_current_ethereum_price
+
+# Read the clock once; a test session never spans enough time for this to go stale
+TODAY = date.today()
+
+# Static Redis payloads, serialized once at import rather than in every fixture call
+CRYPTO_ANALYST_BUDGET_JSON = json.dumps({
+    "agent_id": "crypto_analyst_001",
+    "current_balance": 500000,  # $5000.00 in cents
+    "total_spent": 200000,      # $2000.00 in cents  
+    "total_earned": 350000,     # $3500.00 in cents
+    "daily_spent": 5000,        # $50.00 in cents
+    "daily_limit": 100000,      # $1000.00 daily limit
+    "per_action_limit": 5000,   # $50.00 per action
+    "last_reset_date": TODAY.isoformat(),
+    "is_frozen": False,
+    "total_transactions": 25,
+    "roi_score": 1.75,          # 175% ROI
+    "performance_score": 1.75,
+    "is_active": True
+})
+
+# Multiple agent budgets with different performance levels
+MULTI_AGENT_BUDGETS = MappingProxyType({
+    "kip:budget:top_performer": {
+        "agent_id": "top_performer",
+        "current_balance": 200000,
+        "total_spent": 50000,
+        "total_earned": 150000,
+        "performance_score": 3.0,    # 300% ROI - Excellent
+        "is_active": True
+    },
+    "kip:budget:good_performer": {
+        "agent_id": "good_performer", 
+        "current_balance": 120000,
+        "total_spent": 80000,
+        "total_earned": 120000,
+        "performance_score": 1.5,    # 150% ROI - Good
+        "is_active": True
+    },
+    "kip:budget:average_performer": {
+        "agent_id": "average_performer",
+        "current_balance": 100000,
+        "total_spent": 100000,
+        "total_earned": 100000,
+        "performance_score": 1.0,    # 100% ROI - Average
+        "is_active": True
+    },
+    "kip:budget:poor_performer": {
+        "agent_id": "poor_performer",
+        "current_balance": 30000,
+        "total_spent": 150000,
+        "total_earned": 60000,
+        "performance_score": 0.4,    # 40% ROI - Poor
+        "is_active": True
+    },
+    "kip:budget:critical_performer": {
+        "agent_id": "critical_performer",
+        "current_balance": 10000,
+        "total_spent": 200000,
+        "total_earned": 30000,
+        "performance_score": 0.15,   # 15% ROI - Critical
+        "is_active": False
+    }
+})
+
+# Expected aggregates, derived once from the payloads above
+EXPECTED_TOTAL_BALANCE = sum(b["current_balance"] for b in MULTI_AGENT_BUDGETS.values())  # 460000
+EXPECTED_TOTAL_SPENT = sum(b["total_spent"] for b in MULTI_AGENT_BUDGETS.values())        # 580000
+EXPECTED_TOTAL_EARNED = sum(b["total_earned"] for b in MULTI_AGENT_BUDGETS.values())      # 460000
+EXPECTED_AVERAGE_PERFORMANCE = (
+    sum(b["performance_score"] for b in MULTI_AGENT_BUDGETS.values()) / len(MULTI_AGENT_BUDGETS)
+)  # (3.0 + 1.5 + 1.0 + 0.4 + 0.15) / 5 = 1.21
+EXPECTED_SYSTEM_ROI = EXPECTED_TOTAL_EARNED / EXPECTED_TOTAL_SPENT  # ≈ 0.79
+
+# Read-only view: fixtures shared across tests must never mutate it
+MULTI_AGENT_BUDGETS_JSON = MappingProxyType(
+    {key: json.dumps(budget) for key, budget in MULTI_AGENT_BUDGETS.items()}
+)
+
+
+# Realistic crypto analysis tools with costs; constructed once at import and never mutated.
+# Built with Tool(...) rather than model_construct on purpose: validating once is a schema guard.
+CRYPTO_ANALYSIS_TOOLS = (
+    Tool(
+        tool_name="get_current_bitcoin_price",
+        description="Get real-time Bitcoin price from CoinGecko API",
+        tool_type="market_data",
+        version="1.0.0",
+        module_path="tools.web_tools",
+        function_name="get_current_bitcoin_price",
+        required_authorization="analyst",
+        cost_per_use=500,        # $5.00 per call
+        daily_limit=50,          # 50 calls per day max
+        total_uses=245
+    ),
+    Tool(
+        tool_name="get_current_ethereum_price", 
+        description="Get real-time Ethereum price from CoinGecko API",
+        tool_type="market_data",
+        version="1.0.0", 
+        module_path="tools.web_tools",
+        function_name="get_current_ethereum_price",
+        required_authorization="analyst",
+        cost_per_use=500,        # $5.00 per call
+        daily_limit=50,          # 50 calls per day max
+        total_uses=189
+    ),
+    Tool(
+        tool_name="get_crypto_market_summary",
+        description="Get comprehensive crypto market overview",
+        tool_type="market_analysis",
+        version="1.0.0",
+        module_path="tools.web_tools", 
+        function_name="get_crypto_market_summary",
+        required_authorization="senior_analyst",
+        cost_per_use=1500,       # $15.00 per call - premium tool
+        daily_limit=10,          # 10 calls per day max
+        total_uses=67
+    )
+)
+
+
+# Default-config treasury; it only connects on __aenter__, so one instance serves the module
+TREASURY_CORE = TreasuryCore()
+
+# Tools run during the end-to-end workflow, as (tool, cost in cents)
+WORKFLOW_TOOL_COSTS = (
+    ("get_bitcoin_price", 500),       # $5.00
+    ("get_ethereum_price", 500),      # $5.00
+    ("market_analysis", 1500),        # $15.00
+    ("portfolio_optimization", 2500)  # $25.00
+)
+WORKFLOW_TOOL_COSTS_TOTAL = sum(cost for _, cost in WORKFLOW_TOOL_COSTS)
+
+# Budget adjustment per performance tier as (ROI threshold, adjustment), highest first
+PERFORMANCE_TIERS = (
+    (2.0, MappingProxyType({
+        "performance_tier": "excellent",
+        "budget_adjustment": "+50%",
+        "recommended_multiplier": 1.5  # 50% increase
+    })),
+    (float("-inf"), MappingProxyType({
+        "performance_tier": "good",
+        "budget_adjustment": "no change"
+    })),
+)
+
+# Fresh, neutral-ROI agent with standard limits; workflow tests derive variants via model_copy
+WORKFLOW_BUDGET_PROTOTYPE = AgentBudget(
+    agent_id="workflow_agent",
+    current_balance=0,
+    daily_limit=100000,     # $1,000.00 daily
+    per_action_limit=5000,  # $50.00 per action
+    last_reset_date=TODAY,
+    total_earned=0,
+    total_spent=0,
+    daily_spent=0,
+    is_frozen=False,
+    roi_score=1.0           # Neutral starting ROI
+)
+
+
+def build_budget(**fields) -> AgentBudget:
+    """Build an AgentBudget from known-good test values without re-running validation."""
+    return AgentBudget.model_construct(**fields)
+
+
+def build_transaction(**fields) -> Transaction:
+    """Build a Transaction from known-good test values without re-running validation."""
+    return Transaction.model_construct(**fields)
+
+
+# Expected competition outcomes as (agent id, total cost, successful trades, earnings, exact ROI)
+COMPETITION_EXPECTATIONS = (
+    ("conservative_trader", 5000, 8, 16000, Fraction(16, 5)),  # 10 trades, 80% success, $20 per win
+    ("aggressive_trader", 7500, 3, 24000, Fraction(16, 5)),    # 5 trades, 60% success, $80 per win
+    ("data_driven_trader", 7000, 6, 27000, Fraction(27, 7)),   # 8 trades, 75% success, $45 per win
+)
+
+# One competing agent's scored performance: fixed fields, read as attributes
+Perf = namedtuple(
+    "Perf", "agent_id strategy total_cost successful_trades total_earnings roi net_profit"
+)
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the async Redis calls the KIP economic modules make."""
+    
+    __slots__ = ("_data",)
+    
+    def __init__(self, data: Dict[str, str]):
+        self._data = dict(data)  # Own copy, so set() never leaks into shared payloads
+    
+    async def get(self, key: str):
+        return self._data.get(key)
+    
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        return [self._data.get(key) for key in keys]
+    
+    async def set(self, key: str, value: str):
+        self._data[key] = value
+    
+    async def keys(self, pattern: str) -> List[str]:
+        return list(self._data)  # Every stored key, regardless of pattern
+    
+    async def lrange(self, key: str, start: int, end: int) -> List[str]:
+        return []  # No transaction history
 
 
 class TestIndividualAgentEconomics:
     """Test individual agent budget management and financial controls."""
     
-    @pytest.fixture
-    async def mock_redis(self):
-        """Mock Redis client for economic data storage."""
-        redis_mock = AsyncMock()
-        # Mock Redis responses for agent budget data
-        redis_mock.get.return_value = json.dumps({
-            "agent_id": "crypto_analyst_001",
-            "current_balance": 500000,  # $5000.00 in cents
-            "total_spent": 200000,      # $2000.00 in cents  
-            "total_earned": 350000,     # $3500.00 in cents
-            "daily_spent": 5000,        # $50.00 in cents
-            "daily_limit": 100000,      # $1000.00 daily limit
-            "per_action_limit": 5000,   # $50.00 per action
-            "last_reset_date": str(date.today()),
-            "is_frozen": False,
-            "total_transactions": 25,
-            "roi_score": 1.75,          # 175% ROI
-            "performance_score": 1.75,
-            "is_active": True
-        })
-        return redis_mock
+    @pytest.fixture(scope="module")
+    def mock_redis(self):
+        """Fake Redis client holding one agent budget (shared per module)."""
+        return FakeRedis({"budget:crypto_analyst_001": CRYPTO_ANALYST_BUDGET_JSON})
     
-    @pytest.fixture 
-    async def budget_manager(self, mock_redis):
+    @pytest.fixture(scope="module")
+    def budget_manager(self, mock_redis):
         """Create budget manager with mocked Redis."""
         return BudgetManager(mock_redis)
     
-    @pytest.fixture
-    async def transaction_processor(self, mock_redis, budget_manager):
+    @pytest.fixture(scope="module")
+    def transaction_processor(self, mock_redis, budget_manager):
         """Create transaction processor with mocked Redis."""
         # Mock TigerGraph connection
         mock_tigergraph = AsyncMock()
         return TransactionProcessor(mock_redis, mock_tigergraph, budget_manager)
     
-    @pytest.fixture
-    async def economic_analyzer(self, mock_redis, budget_manager, transaction_processor):
+    @pytest.fixture(scope="module")
+    def economic_analyzer(self, mock_redis, budget_manager, transaction_processor):
         """Create economic analyzer with all dependencies."""
         return EconomicAnalyzer(mock_redis, budget_manager, transaction_processor)
     
-    @pytest.mark.asyncio
-    async def test_agent_budget_allocation(self, mock_redis):
+    def test_agent_budget_allocation(self):
         """Test creating and managing agent budgets."""
         # Create budget directly using AgentBudget model to test economic concepts
-        from datetime import date
-        
         budget = AgentBudget(
             agent_id="market_analyst_001",
             current_balance=100000,      # $1000.00
             daily_limit=50000,           # $500.00 daily limit
             per_action_limit=2000,       # $20.00 per action
-            last_reset_date=date.today(),
+            last_reset_date=TODAY,
             total_earned=100000,         # Initial seed funding counts as earnings
             total_spent=0,               # No spending yet
             daily_spent=0,               # No spending today
@@ -115,18 +307,15 @@ class TestIndividualAgentEconomics:
         assert budget.available_daily_budget == 50000  # Full daily budget available
         assert budget.net_worth == 100000  # $1000.00 profit (earned - spent)
     
-    @pytest.mark.asyncio 
-    async def test_agent_spending_controls(self, mock_redis):
+    def test_agent_spending_controls(self):
         """Test spending limits and controls prevent overspending."""
-        from datetime import date
-        
         # Create agent with tight spending limits
-        budget = AgentBudget(
+        budget = build_budget(
             agent_id="restricted_agent_001",
             current_balance=50000,       # $500.00
             daily_limit=10000,           # $100.00 daily limit
             per_action_limit=1000,       # $10.00 per action limit
-            last_reset_date=date.today(),
+            last_reset_date=TODAY,
             total_earned=50000,          # Initial seed funding
             total_spent=0,
             daily_spent=0
@@ -148,38 +337,40 @@ class TestIndividualAgentEconomics:
         budget.current_balance = 0
         assert budget.can_spend is False
     
-    @pytest.mark.asyncio
-    async def test_agent_roi_calculation(self, economic_analyzer):
-        """Test agent ROI calculation and performance scoring thresholds."""
-        # Test the performance thresholds that drive the Economic Darwinism system
-        assert economic_analyzer.EXCELLENT_PERFORMANCE_THRESHOLD == 2.0  # 200% ROI
-        assert economic_analyzer.GOOD_PERFORMANCE_THRESHOLD == 1.5        # 150% ROI
-        assert economic_analyzer.POOR_PERFORMANCE_THRESHOLD == 0.5        # 50% ROI
-        assert economic_analyzer.CRITICAL_PERFORMANCE_THRESHOLD == 0.2    # 20% ROI
-        
-        # Test adjustment multipliers that reward/penalize agents
-        assert economic_analyzer.EXCELLENT_MULTIPLIER == 1.5  # 50% budget increase
-        assert economic_analyzer.GOOD_MULTIPLIER == 1.2       # 20% budget increase
-        assert economic_analyzer.NEUTRAL_MULTIPLIER == 1.0    # No change
-        assert economic_analyzer.POOR_MULTIPLIER == 0.8       # 20% budget decrease
-        assert economic_analyzer.CRITICAL_MULTIPLIER == 0.5   # 50% budget decrease
-        
-        # Test ROI scenarios that would trigger different adjustments
+    @pytest.mark.parametrize("attr,expected", [
+        # Performance thresholds that drive the Economic Darwinism system
+        ("EXCELLENT_PERFORMANCE_THRESHOLD", 2.0),  # 200% ROI
+        ("GOOD_PERFORMANCE_THRESHOLD", 1.5),       # 150% ROI
+        ("POOR_PERFORMANCE_THRESHOLD", 0.5),       # 50% ROI
+        ("CRITICAL_PERFORMANCE_THRESHOLD", 0.2),   # 20% ROI
+        # Adjustment multipliers that reward/penalize agents
+        ("EXCELLENT_MULTIPLIER", 1.5),  # 50% budget increase
+        ("GOOD_MULTIPLIER", 1.2),       # 20% budget increase
+        ("NEUTRAL_MULTIPLIER", 1.0),    # No change
+        ("POOR_MULTIPLIER", 0.8),       # 20% budget decrease
+        ("CRITICAL_MULTIPLIER", 0.5),   # 50% budget decrease
+    ])
+    def test_agent_roi_calculation(self, economic_analyzer, attr, expected):
+        """Test agent ROI performance scoring thresholds and adjustment multipliers."""
+        assert getattr(economic_analyzer, attr) == expected
+    
+    @pytest.mark.parametrize("earned,spent,threshold_attr,compare", [
         # Excellent performance: Agent that turns $100 into $200+ (200%+ ROI)
-        excellent_roi = 250000 / 100000  # $2500 earned / $1000 spent = 2.5 ROI
-        assert excellent_roi > economic_analyzer.EXCELLENT_PERFORMANCE_THRESHOLD
-        
+        (250000, 100000, "EXCELLENT_PERFORMANCE_THRESHOLD", operator.gt),  # 2.5 ROI
         # Poor performance: Agent that turns $100 into $40 (40% ROI)
-        poor_roi = 40000 / 100000  # $400 earned / $1000 spent = 0.4 ROI  
-        assert poor_roi < economic_analyzer.POOR_PERFORMANCE_THRESHOLD
+        (40000, 100000, "POOR_PERFORMANCE_THRESHOLD", operator.lt),  # 0.4 ROI
+    ], ids=["excellent", "poor"])
+    def test_roi_scenarios_trigger_adjustments(self, economic_analyzer, earned, spent, threshold_attr, compare):
+        """Test ROI scenarios that would trigger different adjustments."""
+        roi = earned / spent
+        assert compare(roi, getattr(economic_analyzer, threshold_attr))
     
-    @pytest.mark.asyncio
-    async def test_transaction_logging(self, mock_redis):
+    def test_transaction_logging(self):
         """Test complete financial transaction audit trail."""
         agent_id = "audit_agent_001"
         
         # Create transaction directly to test the economic audit model
-        transaction = Transaction(
+        transaction = build_transaction(
             agent_id=agent_id,
             amount_cents=-5000,  # $50.00 spent
             transaction_type=TransactionType.SPENDING,
@@ -214,11 +405,10 @@ class TestIndividualAgentEconomics:
         assert transaction.timestamp is not None
         assert transaction.processed_by == "treasury_system"
     
-    @pytest.mark.asyncio
-    async def test_net_worth_calculation(self):
+    def test_net_worth_calculation(self):
         """Test agent net worth and financial health calculations."""
         # Create agent with positive ROI
-        profitable_agent = AgentBudget(
+        profitable_agent = build_budget(
             agent_id="profitable_agent",
             current_balance=150000,     # $1500.00
             total_spent=100000,         # $1000.00 spent
@@ -226,7 +416,7 @@ class TestIndividualAgentEconomics:
             daily_spent=2000,           # $20.00 today
             daily_limit=50000,          # $500.00 daily limit
             per_action_limit=5000,      # $50.00 per action
-            last_reset_date=date.today(),
+            last_reset_date=TODAY,
             roi_score=1.75              # 175% ROI
         )
         
@@ -236,7 +426,7 @@ class TestIndividualAgentEconomics:
         assert profitable_agent.available_daily_budget == 48000  # $480.00 remaining today
         
         # Create agent with negative ROI  
-        losing_agent = AgentBudget(
+        losing_agent = build_budget(
             agent_id="losing_agent",
             current_balance=25000,      # $250.00
             total_spent=150000,         # $1500.00 spent
@@ -244,7 +434,7 @@ class TestIndividualAgentEconomics:
             daily_spent=45000,          # $450.00 today
             daily_limit=50000,          # $500.00 daily limit
             per_action_limit=5000,      # $50.00 per action
-            last_reset_date=date.today(),
+            last_reset_date=TODAY,
             roi_score=0.33              # 33% ROI - poor performance
         )
         
@@ -257,68 +447,13 @@ class TestIndividualAgentEconomics:
 class TestMultiAgentCompetition:
     """Test multi-agent economic competition and performance ranking."""
     
-    @pytest.fixture
-    async def mock_redis_multi_agent(self):
-        """Mock Redis with multiple agent data for competition testing."""
-        redis_mock = AsyncMock()
-        
-        # Mock multiple agent budgets with different performance levels
-        agent_data = {
-            "kip:budget:top_performer": json.dumps({
-                "agent_id": "top_performer",
-                "current_balance": 200000,
-                "total_spent": 50000,
-                "total_earned": 150000,
-                "performance_score": 3.0,    # 300% ROI - Excellent
-                "is_active": True
-            }),
-            "kip:budget:good_performer": json.dumps({
-                "agent_id": "good_performer", 
-                "current_balance": 120000,
-                "total_spent": 80000,
-                "total_earned": 120000,
-                "performance_score": 1.5,    # 150% ROI - Good
-                "is_active": True
-            }),
-            "kip:budget:average_performer": json.dumps({
-                "agent_id": "average_performer",
-                "current_balance": 100000,
-                "total_spent": 100000,
-                "total_earned": 100000,
-                "performance_score": 1.0,    # 100% ROI - Average
-                "is_active": True
-            }),
-            "kip:budget:poor_performer": json.dumps({
-                "agent_id": "poor_performer",
-                "current_balance": 30000,
-                "total_spent": 150000,
-                "total_earned": 60000,
-                "performance_score": 0.4,    # 40% ROI - Poor
-                "is_active": True
-            }),
-            "kip:budget:critical_performer": json.dumps({
-                "agent_id": "critical_performer",
-                "current_balance": 10000,
-                "total_spent": 200000,
-                "total_earned": 30000,
-                "performance_score": 0.15,   # 15% ROI - Critical
-                "is_active": False
-            })
-        }
-        
-        async def mock_get(key):
-            return agent_data.get(key)
-        
-        async def mock_keys(pattern):
-            return list(agent_data.keys())
-        
-        redis_mock.get.side_effect = mock_get
-        redis_mock.keys.side_effect = mock_keys
-        
-        return redis_mock
+    @pytest.fixture(scope="module")
+    def mock_redis_multi_agent(self):
+        """Fake Redis with multiple agent data for competition testing (shared per module)."""
+        return FakeRedis(MULTI_AGENT_BUDGETS_JSON)
     
-    @pytest.fixture
-    async def economic_analyzer_multi(self, mock_redis_multi_agent):
+    @pytest.fixture(scope="module")
+    def economic_analyzer_multi(self, mock_redis_multi_agent):
         """Create economic analyzer with multi-agent data."""
         budget_manager = BudgetManager(mock_redis_multi_agent)
         mock_tigergraph = AsyncMock()
@@ -336,9 +471,9 @@ class TestMultiAgentCompetition:
         assert analytics.active_agents == 4  # One agent is inactive
         
         # Verify financial totals
-        assert analytics.total_balance == 460000    # Sum of all balances
-        assert analytics.total_spent == 580000      # Sum of all spending
-        assert analytics.total_earned == 460000     # Sum of all earnings
+        assert analytics.total_balance == EXPECTED_TOTAL_BALANCE    # Sum of all balances
+        assert analytics.total_spent == EXPECTED_TOTAL_SPENT        # Sum of all spending
+        assert analytics.total_earned == EXPECTED_TOTAL_EARNED      # Sum of all earnings
         
         # Verify performance classification
         assert "top_performer" in analytics.top_performers
@@ -347,8 +482,7 @@ class TestMultiAgentCompetition:
         assert "critical_performer" in analytics.poor_performers
         
         # Verify system ROI calculation
-        expected_system_roi = 460000 / 580000  # total_earned / total_spent ≈ 0.79
-        assert abs(analytics.system_roi - expected_system_roi) < 0.01
+        assert analytics.system_roi == pytest.approx(EXPECTED_SYSTEM_ROI, abs=0.01)
     
     @pytest.mark.asyncio
     async def test_performance_based_budget_adjustments(self, economic_analyzer_multi):
@@ -385,9 +519,7 @@ class TestMultiAgentCompetition:
         assert expected_poor_performers.issubset(actual_poor_performers)
         
         # Verify average performance calculation
-        # (3.0 + 1.5 + 1.0 + 0.4 + 0.15) / 5 = 1.21
-        expected_avg = (3.0 + 1.5 + 1.0 + 0.4 + 0.15) / 5
-        assert abs(analytics.average_performance - expected_avg) < 0.01
+        assert analytics.average_performance == pytest.approx(EXPECTED_AVERAGE_PERFORMANCE, abs=0.01)
 
 
 class TestToolEconomics:
@@ -395,48 +527,10 @@ class TestToolEconomics:
     
     @pytest.fixture
     def crypto_analysis_tools(self):
-        """Create realistic crypto analysis tools with costs."""
-        return [
-            Tool(
-                tool_name="get_current_bitcoin_price",
-                description="Get real-time Bitcoin price from CoinGecko API",
-                tool_type="market_data",
-                version="1.0.0",
-                module_path="tools.web_tools",
-                function_name="get_current_bitcoin_price",
-                required_authorization="analyst",
-                cost_per_use=500,        # $5.00 per call
-                daily_limit=50,          # 50 calls per day max
-                total_uses=245
-            ),
-            Tool(
-                tool_name="get_current_ethereum_price", 
-                description="Get real-time Ethereum price from CoinGecko API",
-                tool_type="market_data",
-                version="1.0.0", 
-                module_path="tools.web_tools",
-                function_name="get_current_ethereum_price",
-                required_authorization="analyst",
-                cost_per_use=500,        # $5.00 per call
-                daily_limit=50,          # 50 calls per day max
-                total_uses=189
-            ),
-            Tool(
-                tool_name="get_crypto_market_summary",
-                description="Get comprehensive crypto market overview",
-                tool_type="market_analysis",
-                version="1.0.0",
-                module_path="tools.web_tools", 
-                function_name="get_crypto_market_summary",
-                required_authorization="senior_analyst",
-                cost_per_use=1500,       # $15.00 per call - premium tool
-                daily_limit=10,          # 10 calls per day max
-                total_uses=67
-            )
-        ]
+        """Realistic crypto analysis tools with costs (read-only, built once at import)."""
+        return CRYPTO_ANALYSIS_TOOLS
     
-    @pytest.mark.asyncio
-    async def test_tool_cost_calculation(self, crypto_analysis_tools):
+    def test_tool_cost_calculation(self, crypto_analysis_tools):
         """Test tool execution cost tracking and ROI calculation."""
         btc_tool = crypto_analysis_tools[0]  # Bitcoin price tool
         
@@ -457,8 +551,7 @@ class TestToolEconomics:
         premium_total_cost = premium_tool.total_uses * premium_tool.cost_per_use
         assert premium_total_cost == 100500  # $1,005.00 for premium analysis
     
-    @pytest.mark.asyncio
-    async def test_tool_roi_scenarios(self):
+    def test_tool_roi_scenarios(self):
         """Test realistic tool ROI scenarios for crypto trading."""
         # Scenario 1: Profitable Bitcoin analysis
         btc_analysis_action = ActionResult(
@@ -502,8 +595,7 @@ class TestToolEconomics:
         neutral_roi = neutral_value / failed_analysis_action.cost_cents
         assert neutral_roi == 0.0  # 0% ROI - tool cost not recovered
     
-    @pytest.mark.asyncio
-    async def test_daily_tool_limits(self, crypto_analysis_tools):
+    def test_daily_tool_limits(self, crypto_analysis_tools):
         """Test daily tool usage limits prevent overspending."""
         btc_tool = crypto_analysis_tools[0]
         
@@ -529,10 +621,10 @@ class TestToolEconomics:
 class TestEconomicScenarios:
     """Test real-world economic scenarios and decision workflows."""
     
-    @pytest.fixture
-    async def trading_agent_budget(self):
-        """Create a realistic crypto trading agent budget."""
-        return AgentBudget(
+    @pytest.fixture(scope="module")
+    def trading_agent_budget_template(self):
+        """Realistic crypto trading agent budget, constructed once (unvalidated) per module."""
+        return build_budget(
             agent_id="crypto_trader_premium",
             current_balance=1000000,    # $10,000.00 starting capital
             total_spent=250000,         # $2,500.00 spent so far
@@ -540,38 +632,33 @@ class TestEconomicScenarios:
             daily_spent=15000,          # $150.00 spent today
             daily_limit=200000,         # $2,000.00 daily limit
             per_action_limit=5000,      # $50.00 per action limit
-            last_reset_date=date.today(),
+            last_reset_date=TODAY,
             is_frozen=False,
             total_transactions=156,
             roi_score=1.6               # 160% ROI - good performance
         )
     
-    @pytest.mark.asyncio
-    async def test_profitable_trading_day(self, trading_agent_budget):
+    @pytest.fixture
+    def trading_agent_budget(self, trading_agent_budget_template):
+        """Create a realistic crypto trading agent budget (tests mutate it, so copy per test)."""
+        return trading_agent_budget_template.model_copy(deep=True)
+    
+    def test_profitable_trading_day(self, trading_agent_budget):
         """Test a profitable crypto trading day with multiple tool uses."""
         agent = trading_agent_budget
         initial_balance = agent.current_balance
         
-        # Morning: Check Bitcoin price ($5.00)
-        btc_check_cost = 500
-        agent.current_balance -= btc_check_cost
-        agent.daily_spent += btc_check_cost
-        agent.total_spent += btc_check_cost
-        
-        # Midday: Check Ethereum price ($5.00) 
-        eth_check_cost = 500
-        agent.current_balance -= eth_check_cost
-        agent.daily_spent += eth_check_cost
-        agent.total_spent += eth_check_cost
-        
-        # Afternoon: Premium market analysis ($15.00)
-        market_analysis_cost = 1500
-        agent.current_balance -= market_analysis_cost
-        agent.daily_spent += market_analysis_cost
-        agent.total_spent += market_analysis_cost
-        
-        # Total tool costs for the day
-        total_tool_costs = btc_check_cost + eth_check_cost + market_analysis_cost
+        tool_costs = (
+            500,   # Morning: Check Bitcoin price ($5.00)
+            500,   # Midday: Check Ethereum price ($5.00)
+            1500,  # Afternoon: Premium market analysis ($15.00)
+        )
+        
+        # Total tool costs for the day, applied to the budget in one update
+        total_tool_costs = sum(tool_costs)
+        agent.current_balance -= total_tool_costs
+        agent.daily_spent += total_tool_costs
+        agent.total_spent += total_tool_costs
         assert total_tool_costs == 2500  # $25.00 in tools ($5 + $5 + $15)
         
         # Simulate successful trading profit of $800.00
@@ -591,8 +678,7 @@ class TestEconomicScenarios:
         new_roi = agent.total_earned / agent.total_spent
         assert new_roi > 1.6  # ROI improved from successful day
     
-    @pytest.mark.asyncio
-    async def test_budget_constraint_decision_making(self, trading_agent_budget):
+    def test_budget_constraint_decision_making(self, trading_agent_budget):
         """Test agent decision making under budget constraints."""
         agent = trading_agent_budget
         
@@ -619,11 +705,10 @@ class TestEconomicScenarios:
         assert agent.can_spend is True  # Still has account balance
         # But daily limit reached, so premium tools unavailable until reset
     
-    @pytest.mark.asyncio
-    async def test_economic_emergency_scenarios(self):
+    def test_economic_emergency_scenarios(self):
         """Test emergency economic scenarios and recovery mechanisms."""
         # Scenario: Agent with critical performance needs intervention
-        critical_agent = AgentBudget(
+        critical_agent = build_budget(
             agent_id="emergency_agent_001",
             current_balance=5000,       # $50.00 - very low
             total_spent=500000,         # $5,000.00 spent
@@ -631,7 +716,7 @@ class TestEconomicScenarios:
             daily_spent=4000,           # $40.00 today
             daily_limit=10000,          # $100.00 daily limit
             per_action_limit=2000,      # $20.00 per action
-            last_reset_date=date.today(),
+            last_reset_date=TODAY,
             is_frozen=False,
             total_transactions=387,
             roi_score=0.15              # 15% ROI - critical performance
@@ -662,70 +747,29 @@ class TestEconomicScenarios:
 class TestEconomicIntegrationScenarios:
     """Test end-to-end economic scenarios with full KIP integration."""
     
-    @pytest.fixture
-    async def mock_treasury_system(self):
-        """Mock complete treasury system for integration testing."""
-        mock_redis = AsyncMock()
-        
-        # Mock treasury data
-        treasury_data = {
-            "kip:treasury:stats": json.dumps({
-                "total_agents": 12,
-                "active_agents": 10,
-                "total_balance": 2500000,   # $25,000.00
-                "daily_spending": 45000,    # $450.00 today
-                "monthly_budget": 1000000   # $10,000.00 monthly
-            })
-        }
-        
-        async def mock_get(key):
-            return treasury_data.get(key)
-        
-        mock_redis.get.side_effect = mock_get
-        
-        budget_manager = BudgetManager(mock_redis)
-        mock_tigergraph = AsyncMock()
-        transaction_processor = TransactionProcessor(mock_redis, mock_tigergraph, budget_manager)
-        economic_analyzer = EconomicAnalyzer(mock_redis, budget_manager, transaction_processor)
-        
-        # Create TreasuryCore with default config (it manages its own components)
-        return TreasuryCore()
+    @pytest.fixture(scope="module")
+    def mock_treasury_system(self):
+        """Treasury for integration testing, shared per module (connects lazily, so nothing to mock)."""
+        return TREASURY_CORE
     
-    @pytest.mark.asyncio
-    async def test_full_economic_workflow(self, mock_treasury_system):
+    def test_full_economic_workflow(self, mock_treasury_system):
         """Test complete economic workflow from agent creation to performance review."""
-        treasury = mock_treasury_system
-        
         # Step 1: Create new agent with initial funding
         agent_id = "integration_test_agent"
         initial_funding = 500000  # $5,000.00
         
         # Step 1: Create new agent budget (simulating treasury initialization)
-        from datetime import date
-        initial_budget = AgentBudget(
-            agent_id=agent_id,
-            current_balance=initial_funding,
-            daily_limit=100000,     # $1,000.00 daily
-            per_action_limit=5000,  # $50.00 per action
-            last_reset_date=date.today(),
-            total_earned=initial_funding,  # Initial seed funding
-            total_spent=0,
-            daily_spent=0,
-            roi_score=1.0           # Neutral starting ROI
-        )
+        initial_budget = WORKFLOW_BUDGET_PROTOTYPE.model_copy(update={
+            "agent_id": agent_id,
+            "current_balance": initial_funding,
+            "total_earned": initial_funding  # Initial seed funding
+        })
         
         assert initial_budget.current_balance == initial_funding
         assert initial_budget.roi_score == 1.0  # Neutral starting performance
         
         # Step 2: Agent executes tools and incurs costs
-        tool_costs = [
-            ("get_bitcoin_price", 500),    # $5.00
-            ("get_ethereum_price", 500),   # $5.00  
-            ("market_analysis", 1500),     # $15.00
-            ("portfolio_optimization", 2500) # $25.00
-        ]
-        
-        total_costs = sum(cost for _, cost in tool_costs)
+        total_costs = WORKFLOW_TOOL_COSTS_TOTAL
         assert total_costs == 5000  # $50.00 total tool costs
         
         # Step 3: Agent generates value from tool usage
@@ -734,19 +778,15 @@ class TestEconomicIntegrationScenarios:
         assert roi_ratio == 2.4  # 240% ROI - excellent performance
         
         # Step 4: Update agent performance metrics
-        updated_budget = AgentBudget(
-            agent_id=agent_id,
-            current_balance=initial_funding - total_costs + generated_value,
-            total_spent=total_costs,
-            total_earned=generated_value,
-            daily_spent=total_costs,
-            daily_limit=100000,
-            per_action_limit=5000,
-            last_reset_date=date.today(),
-            is_frozen=False,
-            total_transactions=len(tool_costs),
-            roi_score=roi_ratio
-        )
+        updated_budget = WORKFLOW_BUDGET_PROTOTYPE.model_copy(update={
+            "agent_id": agent_id,
+            "current_balance": initial_funding - total_costs + generated_value,
+            "total_spent": total_costs,
+            "total_earned": generated_value,
+            "daily_spent": total_costs,
+            "total_transactions": len(WORKFLOW_TOOL_COSTS),
+            "roi_score": roi_ratio
+        })
         
         # Verify economic success
         assert updated_budget.net_worth == 7000     # $70.00 profit
@@ -754,26 +794,11 @@ class TestEconomicIntegrationScenarios:
         
         # Step 5: Simulate performance-based budget adjustment (conceptual test)
         # In a real system, this would be done by the Treasury's economic analyzer
-        excellent_performance_threshold = 2.0
-        if roi_ratio > excellent_performance_threshold:
+        tier = next(tier for threshold, tier in PERFORMANCE_TIERS if roi_ratio > threshold)
+        roi_analysis = {"agent_id": agent_id, "roi": roi_ratio, **tier}
+        if "recommended_multiplier" in tier:
             # Excellent performers get budget increases
-            budget_increase_multiplier = 1.5  # 50% increase
-            new_daily_limit = int(updated_budget.daily_limit * budget_increase_multiplier)
-            roi_analysis = {
-                "agent_id": agent_id,
-                "roi": roi_ratio,
-                "performance_tier": "excellent",
-                "budget_adjustment": "+50%",
-                "new_daily_limit": new_daily_limit,
-                "recommended_multiplier": budget_increase_multiplier
-            }
-        else:
-            roi_analysis = {
-                "agent_id": agent_id,
-                "roi": roi_ratio,
-                "performance_tier": "good",
-                "budget_adjustment": "no change"
-            }
+            roi_analysis["new_daily_limit"] = int(updated_budget.daily_limit * tier["recommended_multiplier"])
         
         # Excellent performance should trigger budget increase
         if "error" not in roi_analysis:
@@ -781,87 +806,90 @@ class TestEconomicIntegrationScenarios:
             recommended_multiplier = roi_analysis.get("recommended_multiplier", 1.0)
             assert recommended_multiplier >= 1.2  # At least 20% increase
     
-    @pytest.mark.asyncio
-    async def test_economic_competition_scenario(self):
-        """Test realistic multi-agent economic competition."""
-        # Create competing crypto analysis agents
-        agents = [
-            {
-                "agent_id": "conservative_trader",
-                "strategy": "low_risk",
-                "tool_usage": [("basic_price_check", 500)] * 10,  # 10 basic calls
-                "success_rate": 0.8,
-                "avg_profit_per_trade": 2000  # $20.00 per successful trade
-            },
-            {
-                "agent_id": "aggressive_trader", 
-                "strategy": "high_risk",
-                "tool_usage": [("premium_analysis", 1500)] * 5,  # 5 premium calls
-                "success_rate": 0.6,
-                "avg_profit_per_trade": 8000  # $80.00 per successful trade
-            },
-            {
-                "agent_id": "data_driven_trader",
-                "strategy": "analytical",
-                "tool_usage": [("basic_price_check", 500)] * 5 + [("market_analysis", 1500)] * 3,
-                "success_rate": 0.75,
-                "avg_profit_per_trade": 4500  # $45.00 per successful trade
-            }
-        ]
-        
-        # Calculate performance for each agent
-        agent_performances = []
-        
-        for agent in agents:
-            # Calculate total tool costs
-            total_cost = sum(cost for _, cost in agent["tool_usage"])
-            
-            # Calculate expected earnings
-            num_trades = len(agent["tool_usage"])
-            successful_trades = int(num_trades * agent["success_rate"])
-            total_earnings = successful_trades * agent["avg_profit_per_trade"]
-            
-            # Calculate ROI
-            roi = total_earnings / total_cost if total_cost > 0 else 0
-            
-            agent_performances.append({
-                "agent_id": agent["agent_id"],
-                "strategy": agent["strategy"],
-                "total_cost": total_cost,
-                "total_earnings": total_earnings,
-                "roi": roi,
-                "net_profit": total_earnings - total_cost
-            })
-        
-        # Analyze competition results
-        conservative = agent_performances[0]  # Conservative trader
-        aggressive = agent_performances[1]    # Aggressive trader
-        analytical = agent_performances[2]    # Data-driven trader
-        
-        # Conservative trader: 10 trades, 80% success, $20 per win
-        assert conservative["total_cost"] == 5000    # $50.00 in basic tools
-        assert conservative["total_earnings"] == 16000  # 8 successful * $20 = $160.00
-        assert conservative["roi"] == 3.2              # 320% ROI
-        
-        # Aggressive trader: 5 trades, 60% success, $80 per win  
-        assert aggressive["total_cost"] == 7500     # $75.00 in premium tools
-        assert aggressive["total_earnings"] == 24000  # 3 successful * $80 = $240.00
-        assert aggressive["roi"] == 3.2               # 320% ROI
-        
-        # Analytical trader: 8 trades, 75% success, $45 per win
-        assert analytical["total_cost"] == 7000     # $70.00 mixed tools
-        assert analytical["total_earnings"] == 27000  # 6 successful * $45 = $270.00
-        assert analytical["roi"] == 27000 / 7000    # ~386% ROI - best performance!
-        
-        # Rank agents by performance
-        ranked_agents = sorted(agent_performances, key=lambda x: x["roi"], reverse=True)
+    @pytest.fixture(scope="module")
+    def competition_agents(self):
+        """Competing crypto analysis agents (read-only, built once per module)."""
+        def agent(costs, **fields):
+            costs.setflags(write=False)
+            return MappingProxyType({**fields, "costs": costs})
+        
+        return (
+            agent(
+                np.full(10, 500, dtype=np.int64),  # 10 basic price checks
+                agent_id="conservative_trader",
+                strategy="low_risk",
+                success_rate=0.8,
+                avg_profit_per_trade=2000  # $20.00 per successful trade
+            ),
+            agent(
+                np.full(5, 1500, dtype=np.int64),  # 5 premium analyses
+                agent_id="aggressive_trader",
+                strategy="high_risk",
+                success_rate=0.6,
+                avg_profit_per_trade=8000  # $80.00 per successful trade
+            ),
+            agent(
+                np.array([500] * 5 + [1500] * 3, dtype=np.int64),  # 5 price checks + 3 market analyses
+                agent_id="data_driven_trader",
+                strategy="analytical",
+                success_rate=0.75,
+                avg_profit_per_trade=4500  # $45.00 per successful trade
+            ),
+        )
+    
+    @pytest.fixture(scope="module")
+    def competition_results(self, competition_agents):
+        """Read-only Perf record for each competing agent keyed by agent id, computed once per module."""
+        # Stack per-agent inputs so every agent is scored in one vectorized pass
+        costs_sum = np.array([agent["costs"].sum() for agent in competition_agents])
+        num_trades = np.array([agent["costs"].size for agent in competition_agents])
+        success_rate = np.array([agent["success_rate"] for agent in competition_agents])
+        avg_profit = np.array([agent["avg_profit_per_trade"] for agent in competition_agents])
+        
+        successful = (num_trades * success_rate).astype(np.int64)
+        earnings = successful * avg_profit
+        net = earnings - costs_sum
+        
+        performances = (
+            Perf(
+                agent_id=agent["agent_id"],
+                strategy=agent["strategy"],
+                total_cost=int(costs_sum[i]),
+                successful_trades=int(successful[i]),
+                total_earnings=int(earnings[i]),
+                roi=Fraction(int(earnings[i]), int(costs_sum[i])),  # Exact ratio, no float division
+                net_profit=int(net[i])
+            )
+            for i, agent in enumerate(competition_agents)
+        )
+        return MappingProxyType({perf.agent_id: perf for perf in performances})
+    
+    @pytest.mark.parametrize("agent_id,exp_cost,exp_successful,exp_earnings,exp_roi", COMPETITION_EXPECTATIONS)
+    def test_economic_competition_scenario(self, competition_results, agent_id, exp_cost, exp_successful, exp_earnings, exp_roi):
+        """Test realistic multi-agent economic competition, one agent per case."""
+        performance = competition_results[agent_id]
+        
+        assert performance.total_cost == exp_cost
+        assert performance.successful_trades == exp_successful
+        assert performance.total_earnings == exp_earnings
+        assert performance.roi == exp_roi  # Exact ratio, no float equality
+        assert performance.net_profit == exp_earnings - exp_cost
+    
+    def test_economic_competition_ranking(self, competition_results):
+        """Test that the analytical strategy wins the competition."""
+        # Only the winner is ranked, so a linear nlargest replaces the full sort
+        top = heapq.nlargest(1, competition_results.values(), key=operator.attrgetter("roi"))[0]
+        others = [perf for perf in competition_results.values() if perf is not top]  # Fixture order
         
         # Analytical strategy wins with highest ROI
-        assert ranked_agents[0]["agent_id"] == "data_driven_trader"
-        assert ranked_agents[0]["roi"] > 3.5  # Best ROI
-        
-        # Conservative and aggressive tied for second
-        assert ranked_agents[1]["roi"] == ranked_agents[2]["roi"] == 3.2
+        assert top.agent_id == "data_driven_trader"
+        assert top.roi > 3.5  # Best ROI
+        
+        # Conservative and aggressive tied for second, compared on exact ratios
+        conservative, aggressive = others
+        assert (conservative.agent_id, aggressive.agent_id) == ("conservative_trader", "aggressive_trader")
+        assert conservative.roi == aggressive.roi
+        assert conservative.roi == Fraction(16, 5)  # 320% ROI
 
 
 if __name__ == "__main__":
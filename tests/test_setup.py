@@ -86,8 +86,13 @@ def test_redis():
         test_key = "hybrid_ai_test"
         test_value = "test_value"
         
-        redis_client.set(test_key, test_value, ex=10)  # 10 second expiry
-        retrieved_value = redis_client.get(test_key)
+        # Write, read back, check TTL and clean up in a single round-trip
+        with redis_client.pipeline(transaction=False) as pipe:
+            pipe.set(test_key, test_value, ex=10)  # 10 second expiry
+            pipe.get(test_key)
+            pipe.ttl(test_key)
+            pipe.delete(test_key)
+            _, retrieved_value, ttl, _ = pipe.execute()
         
         # Handle both bytes and string returns from Redis
         if retrieved_value:
@@ -104,15 +109,12 @@ def test_redis():
             return False
         
         # Test TTL functionality (important for Pheromind 12s TTL)
-        ttl = redis_client.ttl(test_key)
         if ttl > 0:
             print(f"✅ Redis TTL functionality: PASSED ({ttl}s remaining)")
         else:
             print("❌ Redis TTL functionality: FAILED")
             return False
         
-        # Cleanup
-        redis_client.delete(test_key)
         print("✅ Redis: PASSED")
         return True
         
@@ -17,13 +17,15 @@ async def test_voice_foundation():
         
         print("🧪 Testing voice foundation with running service...")
         
-        # Create voice foundation
-        foundation = await create_voice_foundation()
+        # Create voice foundation (bounded so a hung voice service fails fast)
+        async with asyncio.timeout(10):
+            foundation = await create_voice_foundation()
         print(f"✅ Voice foundation created: {foundation is not None}")
         
         if foundation:
             # Test health check
-            health = await foundation.health_check()
+            async with asyncio.timeout(10):
+                health = await foundation.health_check()
             print(f"✅ Health check: {health.get('status', 'unknown')}")
             
             # Check STT
@@ -38,6 +40,9 @@ async def test_voice_foundation():
             print("❌ Voice foundation is None!")
             return False
             
+    except TimeoutError:
+        print("❌ Voice foundation test timed out after 10s")
+        return False
     except Exception as e:
         print(f"❌ Voice foundation test failed: {e}")
         import traceback